@@ -1,31 +1,125 @@
 import hashlib
 import random
-import argparse
 import sys
 
 
-def calculate_participant_hash(participants):
+def _canonicalize(participants):
     """
-    Calculates the SHA-256 hash of the sorted participant list.
+    Builds the canonical form of a participant list.
 
     Args:
         participants (list): List of participant names.
 
     Returns:
-        str: The hex digest of the hash.
+        tuple: (sorted_list, canonical_bytes) where canonical_bytes is the
+        UTF-8 encoding of the sorted names joined by newlines.
     """
     # Canonicalize by sorting
     candidates = sorted(participants)
     # Use a newline separator to prevent concatenation collisions
     # e.g., ["Alice", "Bob"] vs ["Ali", "ceBob"]
-    raw_string = "\n".join(candidates)
-    return hashlib.sha256(raw_string.encode("utf-8")).hexdigest()
+    # Joining the str list first and encoding once builds the buffer in two
+    # allocations, instead of one bytes object per name plus the join.
+    canonical = "\n".join(candidates).encode("utf-8")
+    return candidates, canonical
+
+
+def calculate_participant_hash(participants):
+    """
+    Calculates the SHA-256 hash of the sorted participant list.
+
+    Args:
+        participants (list): List of participant names.
+
+    Returns:
+        str: The hex digest of the hash.
+    """
+    _, canonical = _canonicalize(participants)
+    return hashlib.sha256(canonical).hexdigest()
+
+
+def _validate_salt(future_salt):
+    """Raises ValueError if the future salt is empty or whitespace."""
+    if not future_salt or not str(future_salt).strip():
+        raise ValueError("Future salt cannot be empty or whitespace.")
+
+
+class FairDrawContext:
+    """
+    A participant list prepared for draws with any number of future salts.
+
+    The list is sorted, encoded and hashed once. SHA-256 processes its input
+    front to back, so the hasher state after the participant prefix is kept
+    and each draw only hashes the salt on top of a copy of it.
+
+    Attributes:
+        candidates (tuple): The sorted participant list. It is a tuple so it
+            cannot drift from participant_hash after construction.
+        participant_hash (str): The hex digest of the participant list.
+    """
+
+    def __init__(self, participants):
+        """
+        Args:
+            participants (list): List of unique participant names/IDs.
+        """
+        # Canonicalize the participant list by sorting.
+        # This ensures that the input order in the file doesn't affect the outcome,
+        # making the process robust against scrambling the input file.
+        candidates, canonical = _canonicalize(participants)
+        self.candidates = tuple(candidates)
+
+        # Calculate Participant Hash (for commitment verification)
+        self._prefix_hasher = hashlib.sha256(canonical)
+        self.participant_hash = self._prefix_hasher.hexdigest()
+
+    def draw(self, future_salt):
+        """
+        Shuffles the participants deterministically based on a future salt.
+
+        Args:
+            future_salt (str): A string derived from a future public signal.
+
+        Returns:
+            tuple: (shuffled_list, participant_hash, seed_int)
+        """
+        # Validate future_salt
+        _validate_salt(future_salt)
+
+        # 1. Deterministic Random Seed
+        # Combine all participants and the salt to create a unique seed string.
+        # The participant list is the same prefix used for the participant hash,
+        # so we extend a copy of that hasher with the salt instead of hashing
+        # the whole list a second time.
+        hasher = self._prefix_hasher.copy()
+        hasher.update(str(future_salt).encode("utf-8"))
+
+        # Convert the full digest to an integer to use as the seed.
+        # Reading the raw digest big-endian gives the same value as parsing the
+        # hex digest, without the round trip through a hex string.
+        seed_int = int.from_bytes(hasher.digest(), "big")
+
+        # 2. Shuffle
+        # Initialize the random number generator with our deterministic seed
+        rng = random.Random(seed_int)
+
+        # Create a copy to shuffle.
+        # The whole list is always shuffled, even if only the top winners are shown:
+        # random.shuffle fixes positions from the end of the list, so the first
+        # places are only settled by its last swaps.
+        shuffled_list = list(self.candidates)
+        rng.shuffle(shuffled_list)
+
+        return shuffled_list, self.participant_hash, seed_int
 
 
 def get_fair_shuffle(participants, future_salt):
     """
     Shuffles a list of participants deterministically based on a future salt.
 
+    To draw the same list with several salts, use FairDrawContext (or
+    batch_fair_shuffle) so the list is only sorted and hashed once.
+
     Args:
         participants (list): List of unique participant names/IDs.
         future_salt (str): A string derived from a future public signal.
@@ -33,53 +127,60 @@ def get_fair_shuffle(participants, future_salt):
     Returns:
         tuple: (shuffled_list, participant_hash, seed_int)
     """
-    # Validate future_salt
-    if not future_salt or not str(future_salt).strip():
-        raise ValueError("Future salt cannot be empty or whitespace.")
+    # Validate future_salt before doing any work on the participant list
+    _validate_salt(future_salt)
 
-    # Canonicalize the participant list by sorting.
-    # This ensures that the input order in the file doesn't affect the outcome,
-    # making the process robust against scrambling the input file.
-    candidates = sorted(participants)
+    return FairDrawContext(participants).draw(future_salt)
 
-    # Calculate Participant Hash (for commitment verification)
-    participant_hash = calculate_participant_hash(participants)
-
-    # 1. Deterministic Random Seed
-    # Combine all participants and the salt to create a unique seed string.
-    # Note: We reconstruct the raw string here to ensure it matches the hash logic
-    # We use the same newline separator for consistency
-    raw_string = "\n".join(candidates) + str(future_salt)
-    
-    # Generate a SHA-256 hash
-    seed_hash = hashlib.sha256(raw_string.encode("utf-8")).hexdigest()
-    
-    # Convert the full digest to an integer to use as the seed
-    seed_int = int(seed_hash, 16)
-    
-    # 2. Shuffle
-    # Initialize the random number generator with our deterministic seed
-    rng = random.Random(seed_int)
-    
-    # Create a copy to shuffle.
-    shuffled_list = candidates.copy()
-    rng.shuffle(shuffled_list)
-    
-    return shuffled_list, participant_hash, seed_int
+
+def batch_fair_shuffle(participants, future_salts):
+    """
+    Runs get_fair_shuffle for one participant list over many future salts.
+
+    Useful for audits or simulations across candidate signals. The list is
+    sorted and hashed once; each salt only hashes its own bytes on top of
+    the shared prefix.
+
+    Args:
+        participants (list): List of unique participant names/IDs.
+        future_salts (iterable): Strings derived from future public signals.
+
+    Returns:
+        list: One (shuffled_list, participant_hash, seed_int) tuple per salt,
+        identical to what get_fair_shuffle returns for that salt.
+    """
+    # Materialize first so one-shot iterators survive the validation pass
+    future_salts = list(future_salts)
+
+    # Validate every salt before doing any work
+    for future_salt in future_salts:
+        _validate_salt(future_salt)
+
+    context = FairDrawContext(participants)
+    return [context.draw(future_salt) for future_salt in future_salts]
 
 
 def load_participants(file_path):
     """Reads participants from a file, one per line."""
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            # Read lines, strip whitespace, and filter out empty lines
-            return [line.strip() for line in f if line.strip()]
+            data = f.read()
     except FileNotFoundError:
         print(f"Error: File not found at '{file_path}'")
         sys.exit(1)
 
+    # Split lines, strip whitespace, and filter out empty lines.
+    # Text mode already translates "\r\n" and "\r" to "\n", so splitting on
+    # "\n" matches iterating the file line by line (unlike str.splitlines,
+    # which also breaks on form feeds and other Unicode line separators).
+    return [name for name in map(str.strip, data.split("\n")) if name]
+
 
 def main():
+    # Imported here so library users (e.g. audit scripts calling
+    # batch_fair_shuffle) don't pay for argparse and its dependencies.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Conduct a fair, deterministic lucky draw using a future signal."
     )
@@ -1,6 +1,6 @@
 import unittest
 import os
-from fair_draw import get_fair_shuffle, load_participants, calculate_participant_hash
+from fair_draw import get_fair_shuffle, load_participants, calculate_participant_hash, batch_fair_shuffle, FairDrawContext
 
 class TestFairDraw(unittest.TestCase):
     def setUp(self):
@@ -8,6 +8,7 @@ class TestFairDraw(unittest.TestCase):
         self.candidates_path = os.path.join(self.fixtures_dir, 'candidates.txt')
         self.candidates_rev_path = os.path.join(self.fixtures_dir, 'candidates_rev.txt')
         self.candidates_dup_path = os.path.join(self.fixtures_dir, 'candidates_dup.txt')
+        self.candidates_newlines_path = os.path.join(self.fixtures_dir, 'candidates_newlines.txt')
         self.signal = "43"
 
     def test_determinism(self):
@@ -76,6 +77,14 @@ class TestFairDraw(unittest.TestCase):
         with self.assertRaises(ValueError):
             get_fair_shuffle(participants, None)
 
+    def test_empty_salt_checked_first(self):
+        """Test that the salt is validated before the participant list is used."""
+        # Unsortable or missing participant lists must still report the salt error
+        with self.assertRaises(ValueError):
+            get_fair_shuffle(None, "")
+        with self.assertRaises(ValueError):
+            get_fair_shuffle(["a", 1], " ")
+
     def test_calculate_participant_hash(self):
         """Test that participant hash is calculated correctly and order-independently."""
         p1 = ["Alice", "Bob"]
@@ -99,5 +108,83 @@ class TestFairDraw(unittest.TestCase):
         
         self.assertNotEqual(h1, h2)
 
+    def test_load_line_endings(self):
+        """Test that mixed line endings and form feeds keep the same names and hash."""
+        # The fixture mixes "\r\n", a lone "\r", a form feed inside a name,
+        # padding and blank lines. A form feed is not a line break here.
+        participants = load_participants(self.candidates_newlines_path)
+
+        self.assertEqual(participants, ["Alice", "Bob", "Charlie\x0cDavid", "Eve"])
+        self.assertEqual(
+            calculate_participant_hash(participants),
+            "da691c520b7e9e1e073bef6dd6753a02d04d54f1b39fbc0b84516195a71857d3",
+        )
+
+    def test_known_results(self):
+        """Test that published draws (see README examples) stay reproducible."""
+        participants = load_participants(self.candidates_path)
+        expected_hash = "548c9eec1d21f4f5ff02254266c19c794d4196724535f1da57b8fee701fd8121"
+
+        res, participant_hash, seed = get_fair_shuffle(participants, "43")
+        self.assertEqual(participant_hash, expected_hash)
+        self.assertEqual(seed, 47567774649538936044369692665710261716550568601311273110448917217524192329811)
+        self.assertEqual(res[:5], ["Grace", "Heidi", "Charlie", "Ivan", "Frank"])
+
+        res, participant_hash, seed = get_fair_shuffle(participants, "99.99")
+        self.assertEqual(participant_hash, expected_hash)
+        self.assertEqual(seed, 64878408961966585079329822692674089190204533965471390227971372916984257242512)
+        self.assertEqual(res[:3], ["Grace", "Heidi", "Bob"])
+
+    def test_batch_matches_single(self):
+        """Test that batch draws match individual draws for each salt."""
+        participants = load_participants(self.candidates_path)
+        salts = ["43", "99.99", "Signal A"]
+
+        results = batch_fair_shuffle(participants, salts)
+
+        self.assertEqual(len(results), len(salts))
+        for salt, result in zip(salts, results):
+            self.assertEqual(result, get_fair_shuffle(participants, salt))
+
+    def test_batch_accepts_generator(self):
+        """Test that salts given as a one-shot iterator are all drawn."""
+        participants = load_participants(self.candidates_path)
+        salts = ["43", "99.99"]
+
+        results = batch_fair_shuffle(participants, (salt for salt in salts))
+
+        self.assertEqual(results, batch_fair_shuffle(participants, salts))
+        self.assertEqual(len(results), len(salts))
+
+    def test_batch_empty_salt(self):
+        """Test that an empty salt anywhere in a batch raises ValueError."""
+        participants = load_participants(self.candidates_path)
+        with self.assertRaises(ValueError):
+            batch_fair_shuffle(participants, ["43", "  "])
+
+    def test_context_matches_single(self):
+        """Test that a reusable draw context matches get_fair_shuffle."""
+        participants = load_participants(self.candidates_rev_path)
+        context = FairDrawContext(participants)
+
+        self.assertEqual(context.candidates, tuple(sorted(participants)))
+        self.assertEqual(context.participant_hash, calculate_participant_hash(participants))
+        for salt in ["43", "99.99", "Signal A"]:
+            self.assertEqual(context.draw(salt), get_fair_shuffle(participants, salt))
+        with self.assertRaises(ValueError):
+            context.draw("")
+
+    def test_context_independent_of_caller_list(self):
+        """Test that changing the caller's list after setup does not affect draws."""
+        participants = load_participants(self.candidates_path)
+        original = list(participants)
+        context = FairDrawContext(participants)
+
+        participants.append("Mallory")
+        participants.sort(reverse=True)
+
+        self.assertEqual(context.draw("43"), get_fair_shuffle(original, "43"))
+        self.assertEqual(context.participant_hash, calculate_participant_hash(original))
+
 if __name__ == '__main__':
     unittest.main()